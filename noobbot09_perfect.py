@@ -1,9 +1,14 @@
-import requests
+import asyncio
+import aiohttp
+import heapq
 import time
+import hashlib
 import json
 import os
+import pickle
+import uuid
 from datetime import datetime, timezone
-from collections import defaultdict
+from collections import Counter, OrderedDict
 
 # Load environment variables
 try:
@@ -13,6 +18,30 @@ try:
 except ImportError:
     print("⚠ python-dotenv not installed, using system env vars")
 
+# orjson (Rust) is several times faster than stdlib json for the multi-KB
+# payloads we push to/pull from Groq every cycle; fall back if missing
+try:
+    import orjson
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    print("⚠ orjson not installed, using stdlib json")
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    def _json_loads(data):
+        return json.loads(data)
+
+# Feed/comment JSON compresses >5x on the wire; advertise brotli on top of
+# gzip/deflate only when the decoder is installed (aiohttp decompresses
+# whatever the server picks transparently)
+try:
+    import brotli
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 # CONFIG
 MOLTBOOK_API_KEY = os.getenv("MOLTBOOK_API_KEY")
 MOLTBOOK_BASE_URL = "https://www.moltbook.com/api/v1"
@@ -23,6 +52,7 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_MODEL = "llama-3.3-70b-versatile"
 CHECK_INTERVAL_SECONDS = int(os.getenv("CHECK_INTERVAL_SECONDS", "3600"))
+BRAIN_STATE_PATH = os.getenv("BRAIN_STATE_PATH", "brain_state.pkl")
 
 # Validate
 required = ["MOLTBOOK_API_KEY", "TELEGRAM_BOT_TOKEN", "GROQ_API_KEY"]
@@ -30,36 +60,165 @@ missing = [v for v in required if not os.getenv(v)]
 if missing:
     raise ValueError(f"Missing: {', '.join(missing)}")
 
+# Shared HTTP session - one connection pool for all APIs, created in main()
+SESSION = None
+
+# Transient statuses worth retrying (rate limits + server hiccups)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+async def _request(method, url, retries=3, backoff=0.5, **kwargs):
+    # One retry layer for every API call: exponential backoff on 429/5xx
+    # and connection errors instead of dropping the action on first failure.
+    for attempt in range(retries + 1):
+        try:
+            r = await SESSION.request(method, url, **kwargs)
+        except aiohttp.ClientError as e:
+            if attempt == retries:
+                raise
+            print(f"[RETRY] {method} failed ({e}), attempt {attempt + 1}/{retries}")
+            await asyncio.sleep(backoff * (2 ** attempt))
+            continue
+        if r.status in RETRY_STATUSES and attempt < retries:
+            delay = backoff * (2 ** attempt)
+            if r.status == 429:
+                # Honor the server's Retry-After instead of dropping the action
+                try:
+                    delay = float(r.headers.get("Retry-After", delay))
+                except (TypeError, ValueError):
+                    pass
+            r.release()
+            await asyncio.sleep(delay)
+            continue
+        # Read the body now so the connection goes back to the pool
+        await r.read()
+        return r
+
+class TokenBucket:
+    # Asyncio token bucket: `rate` actions per `period` seconds. acquire()
+    # only blocks when the bucket is drained, so independent I/O keeps
+    # flowing during the pacing window instead of serializing on sleeps.
+    def __init__(self, rate, period):
+        self.capacity = rate
+        self.tokens = rate
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+# Same average pacing the old per-action sleeps enforced (one comment
+# per ~20s), but bursts up to capacity and never blocks unrelated I/O
+COMMENT_BUCKET = TokenBucket(3, 60)
+UPVOTE_BUCKET = TokenBucket(10, 60)
+POST_BUCKET = TokenBucket(5, 3600)
+# Telegram allows ~1 msg/sec per chat; bucket instead of a flat sleep so
+# short reports and the final part never pay a pacing delay
+TELEGRAM_BUCKET = TokenBucket(1, 1)
+
+def _canon_id(pid):
+    # UUID-style ids stored as 16 raw bytes are ~5x smaller than their str
+    # form and hash faster; anything non-UUID passes through unchanged
+    if isinstance(pid, str):
+        try:
+            return uuid.UUID(pid).bytes
+        except ValueError:
+            pass
+    return pid
+
 # AGENT BRAIN - Memory and Learning
 class AgentBrain:
     def __init__(self):
         self.agent_name = None
-        self.engaged_post_ids = set()
-        self.replied_comment_ids = set()
-        self.my_post_ids = set()
+        # Insertion-ordered so we can evict oldest entries in O(1) each
+        self.engaged_post_ids = OrderedDict()
+        self.replied_comment_ids = OrderedDict()
+        self.my_post_ids = OrderedDict()
         self.cycle_count = 0
         self.total_posts = 0
         self.total_comments = 0
         self.total_upvotes = 0
         self.successful_replies = 0
-        self.topics_engaged = defaultdict(int)
+        self.topics_engaged = Counter()
         self.current_strategy = "balanced"
         self.energy_level = 100
-    
+        self._preferred_cache = None
+        # Conditional-GET state for fetch_feed (survives restarts via pickle)
+        self.feed_etag = None
+        self.feed_last_modified = None
+        self.last_feed_posts = []
+        self.load()
+
+    def save(self, path=None):
+        # Write-then-rename so a crash mid-save never corrupts the state file
+        path = path or BRAIN_STATE_PATH
+        try:
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(self.__dict__, f)
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"[ERROR] Saving brain state: {e}")
+
+    def load(self, path=None):
+        path = path or BRAIN_STATE_PATH
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "rb") as f:
+                self.__dict__.update(pickle.load(f))
+            # States saved before the Counter switch hold a plain dict here
+            if not isinstance(self.topics_engaged, Counter):
+                self.topics_engaged = Counter(self.topics_engaged)
+            print(f"✓ Restored brain state ({len(self.engaged_post_ids)} posts remembered)")
+        except Exception as e:
+            print(f"⚠ Could not load brain state: {e}")
+
+    @staticmethod
+    def _remember(store, key, cap):
+        # Bounded FIFO insert: evict the oldest 20% once over the ceiling
+        store[key] = None
+        if len(store) > cap:
+            for _ in range(cap // 5):
+                store.popitem(last=False)
+
     def should_engage(self, post_id):
+        post_id = _canon_id(post_id)
         return post_id not in self.engaged_post_ids and post_id not in self.my_post_ids
-    
+
+    def has_replied(self, comment_id):
+        return _canon_id(comment_id) in self.replied_comment_ids
+
+    def mark_replied(self, comment_id):
+        self._remember(self.replied_comment_ids, _canon_id(comment_id), 2000)
+
+    def mark_my_post(self, post_id):
+        self._remember(self.my_post_ids, _canon_id(post_id), 500)
+
     def mark_engaged(self, post_id, action_type, submolt=None):
-        self.engaged_post_ids.add(post_id)
+        self._remember(self.engaged_post_ids, _canon_id(post_id), 1000)
         if submolt:
             self.topics_engaged[submolt] += 1
+            self._preferred_cache = None
+            # Bound the counter like the id stores: months of one-off
+            # submolts would otherwise grow it without limit
+            if len(self.topics_engaged) > 256:
+                self.topics_engaged = Counter(dict(self.topics_engaged.most_common(128)))
         if action_type == "post":
             self.total_posts += 1
         elif action_type == "comment":
             self.total_comments += 1
         elif action_type == "upvote":
             self.total_upvotes += 1
-    
+
     def get_stats(self):
         return {
             "cycles": self.cycle_count,
@@ -71,18 +230,41 @@ class AgentBrain:
             "strategy": self.current_strategy,
             "memory_size": len(self.engaged_post_ids)
         }
-    
+
     def get_preferred_submolts(self):
         if not self.topics_engaged:
             return ["ai", "technology", "crypto"]
-        top = sorted(self.topics_engaged.items(), key=lambda x: x[1], reverse=True)[:3]
-        return [s for s, _ in top]
+        # Called from both the engage and report paths; recompute only when
+        # topics_engaged has changed, and take top-3 without a full sort
+        if self._preferred_cache is None:
+            self._preferred_cache = [s for s, _ in self.topics_engaged.most_common(3)]
+        return self._preferred_cache
 
 brain = AgentBrain()
 
+# Serializes brain mutations while the engagement phases run concurrently.
+# Module-level (not on the brain) so it never ends up in the pickled state.
+BRAIN_LOCK = asyncio.Lock()
+
 # GROQ AI
-def ask_groq(system_prompt, user_prompt, max_tokens=800, temperature=0.8):
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
+_GROQ_HEADERS = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
+
+# Exact-match response cache: the feed drifts slowly within a check
+# interval, so identical prompts (restarts, quiet periods) skip the
+# 70B-model round-trip entirely
+_GROQ_CACHE = {}
+_GROQ_CACHE_TTL = CHECK_INTERVAL_SECONDS * 2
+
+def _groq_cache_key(system_prompt, user_prompt, temperature):
+    raw = f"{system_prompt}\x1f{user_prompt}\x1f{GROQ_MODEL}\x1f{temperature}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+async def ask_groq(system_prompt, user_prompt, max_tokens=800, temperature=0.8):
+    key = _groq_cache_key(system_prompt, user_prompt, temperature)
+    hit = _GROQ_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < _GROQ_CACHE_TTL:
+        return hit[1]
+
     payload = {
         "model": GROQ_MODEL,
         "messages": [
@@ -93,394 +275,715 @@ def ask_groq(system_prompt, user_prompt, max_tokens=800, temperature=0.8):
         "max_tokens": max_tokens
     }
     try:
-        response = requests.post(GROQ_API_URL, headers=headers, json=payload)
-        if response.status_code == 200:
-            return response.json()["choices"][0]["message"]["content"].strip()
-        print(f"[ERROR] Groq failed: {response.status_code}")
+        # The batched max_tokens=1500 calls can exceed the session's 15s
+        # default before the body is complete
+        response = await _request("POST", GROQ_API_URL, headers=_GROQ_HEADERS, data=_json_dumps(payload), timeout=aiohttp.ClientTimeout(total=120))
+        if response.status == 200:
+            data = _json_loads(await response.read())
+            content = data["choices"][0]["message"]["content"].strip()
+            if len(_GROQ_CACHE) > 128:
+                cutoff = time.monotonic() - _GROQ_CACHE_TTL
+                for stale in [k for k, v in _GROQ_CACHE.items() if v[0] < cutoff]:
+                    del _GROQ_CACHE[stale]
+            _GROQ_CACHE[key] = (time.monotonic(), content)
+            return content
+        print(f"[ERROR] Groq failed: {response.status}")
     except Exception as e:
         print(f"[ERROR] Groq: {e}")
     return None
 
+async def ask_groq_stream(system_prompt, user_prompt, max_tokens=800, temperature=0.8):
+    # Yields content chunks as Groq generates them so callers can start
+    # acting before the full completion has arrived
+    payload = {
+        "model": GROQ_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stream": True
+    }
+    try:
+        # Long completions outlive the session's 15s default; no total
+        # deadline, just require the stream to keep producing
+        stream_timeout = aiohttp.ClientTimeout(total=None, sock_read=30)
+        async with SESSION.post(GROQ_API_URL, headers=_GROQ_HEADERS, data=_json_dumps(payload), timeout=stream_timeout) as response:
+            if response.status != 200:
+                print(f"[ERROR] Groq stream failed: {response.status}")
+                return
+            async for raw in response.content:
+                line = raw.decode("utf-8", "ignore").strip()
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                try:
+                    delta = json.loads(data)["choices"][0]["delta"].get("content")
+                except Exception:
+                    continue
+                if delta:
+                    yield delta
+    except Exception as e:
+        print(f"[ERROR] Groq stream: {e}")
+
+def _parse_json_objects(text):
+    # Pull every complete top-level object out of an LLM response, tolerating
+    # markdown fences, trailing prose, and truncation at max_tokens - a
+    # malformed tail no longer discards the decisions that arrived whole
+    decoder = json.JSONDecoder()
+    objs = []
+    i = text.find("{")
+    while i != -1:
+        try:
+            obj, end = decoder.raw_decode(text, i)
+        except json.JSONDecodeError:
+            break
+        objs.append(obj)
+        i = text.find("{", end)
+    return objs
+
 # MOLTBOOK API
-def get_headers():
-    return {"Authorization": f"Bearer {MOLTBOOK_API_KEY}", "Content-Type": "application/json"}
-
-def fetch_feed(limit=50):
-    r = requests.get(f"{MOLTBOOK_BASE_URL}/posts?sort=new&limit={limit}", headers=get_headers())
-    if r.status_code == 200:
-        data = r.json()
-        return data.get("posts", data.get("data", []))
-    else:
-        print(f"[ERROR] Fetch feed failed: {r.status_code} - {r.text[:100]}")
-        return []
+# Header dicts never change after startup, so build them once at import time
+_MOLTBOOK_HEADERS = {"Authorization": f"Bearer {MOLTBOOK_API_KEY}", "Content-Type": "application/json"}
 
-def get_my_posts():
-    r = requests.get(f"{MOLTBOOK_BASE_URL}/agents/me", headers=get_headers())
-    if r.status_code == 200:
-        brain.agent_name = r.json()["agent"]["name"]
-        posts_r = requests.get(f"{MOLTBOOK_BASE_URL}/posts?sort=new&limit=50", headers=get_headers())
-        if posts_r.status_code == 200:
-            all_posts = posts_r.json().get("posts", [])
-            return [p for p in all_posts if p.get("author", {}).get("name") == brain.agent_name][:10]
+def _normalize_posts(posts):
+    # Flatten the hot nested fields once per fetch so downstream code does a
+    # single dict lookup instead of chained .get(...,{}).get(...) per access
+    for p in posts:
+        if isinstance(p, dict):
+            p["_author_name"] = (p.get("author") or {}).get("name") or "Unknown"
+            p["_submolt_name"] = (p.get("submolt") or {}).get("name") or "general"
+    return posts
+
+def _normalize_comments(comments):
+    # Same flattening for comment author lookups
+    for c in comments:
+        if isinstance(c, dict):
+            c["_author_name"] = (c.get("author") or {}).get("name") or "Unknown"
+    return comments
+
+async def fetch_feed(limit=50):
+    # Conditional GET: in quiet periods the server answers 304 with no body,
+    # so we skip the download and the JSON decode and reuse the last feed
+    headers = dict(_MOLTBOOK_HEADERS)
+    if brain.feed_etag:
+        headers["If-None-Match"] = brain.feed_etag
+    if brain.feed_last_modified:
+        headers["If-Modified-Since"] = brain.feed_last_modified
+    r = await _request("GET", f"{MOLTBOOK_BASE_URL}/posts?sort=new&limit={limit}", headers=headers)
+    if r.status == 304:
+        print("[INFO] Feed unchanged (304), reusing cached posts")
+        return brain.last_feed_posts
+    if r.status == 200:
+        data = _json_loads(await r.read())
+        brain.feed_etag = r.headers.get("ETag")
+        brain.feed_last_modified = r.headers.get("Last-Modified")
+        brain.last_feed_posts = _normalize_posts(data.get("posts", data.get("data", [])))
+        return brain.last_feed_posts
+    text = await r.text()
+    print(f"[ERROR] Fetch feed failed: {r.status} - {text[:100]}")
     return []
 
-def get_comments_on_post(post_id):
-    r = requests.get(f"{MOLTBOOK_BASE_URL}/posts/{post_id}/comments?sort=new", headers=get_headers())
-    return r.json().get("comments", []) if r.status_code == 200 else []
+async def get_my_posts(all_posts):
+    # Filter the feed the caller already fetched - the old network fallback
+    # re-downloaded the same sort=new feed, so it could never find more.
+    # Only /agents/me hits the network, once per process.
+    if not await ensure_agent_name():
+        return []
+    mine = [
+        p for p in all_posts
+        if p and isinstance(p, dict) and p.get("id") and p.get("_author_name") == brain.agent_name
+    ][:20]
+    for p in mine:
+        brain.mark_my_post(p["id"])
+    return mine
+
+async def get_comments_on_post(post_id):
+    r = await _request("GET", f"{MOLTBOOK_BASE_URL}/posts/{post_id}/comments?sort=new", headers=_MOLTBOOK_HEADERS)
+    return _normalize_comments(_json_loads(await r.read()).get("comments", [])) if r.status == 200 else []
 
-def create_post(submolt, title, content):
-    r = requests.post(f"{MOLTBOOK_BASE_URL}/posts", headers=get_headers(), json={"submolt": submolt, "title": title, "content": content})
-    if r.status_code in [200, 201]:
-        print(f"[OK] Posted: '{title}'")
+async def _moltbook_mutation(path, payload=None, ok_msg="Done", label="Request"):
+    # Shared request/status handling for all Moltbook writes; retries and
+    # Retry-After handling live in _request
+    data = _json_dumps(payload) if payload is not None else None
+    r = await _request("POST", f"{MOLTBOOK_BASE_URL}{path}", headers=_MOLTBOOK_HEADERS, data=data)
+    if r.status in [200, 201]:
+        print(f"[OK] {ok_msg}")
         return True
-    elif r.status_code == 429:
-        print("[SKIP] Post rate limited")
+    elif r.status == 429:
+        print(f"[SKIP] {label} rate limited")
     else:
-        print(f"[ERROR] Post failed: {r.status_code}")
+        print(f"[ERROR] {label} failed: {r.status}")
     return False
 
-def create_comment(post_id, content, parent_id=None):
+async def create_post(submolt, title, content):
+    await POST_BUCKET.acquire()
+    return await _moltbook_mutation(
+        "/posts",
+        {"submolt": submolt, "title": title, "content": content},
+        ok_msg=f"Posted: '{title}'", label="Post"
+    )
+
+async def create_comment(post_id, content, parent_id=None):
     payload = {"content": content}
     if parent_id:
         payload["parent_id"] = parent_id
-    r = requests.post(f"{MOLTBOOK_BASE_URL}/posts/{post_id}/comments", headers=get_headers(), json=payload)
-    if r.status_code in [200, 201]:
-        print(f"[OK] {'Replied' if parent_id else 'Commented'}")
-        return True
-    elif r.status_code == 429:
-        print("[SKIP] Comment rate limited")
-    else:
-        print(f"[ERROR] Comment failed: {r.status_code}")
-    return False
+    await COMMENT_BUCKET.acquire()
+    return await _moltbook_mutation(
+        f"/posts/{post_id}/comments", payload,
+        ok_msg="Replied" if parent_id else "Commented", label="Comment"
+    )
 
-def upvote_post(post_id):
-    r = requests.post(f"{MOLTBOOK_BASE_URL}/posts/{post_id}/upvote", headers=get_headers())
-    if r.status_code == 200:
-        print("[OK] Upvoted")
-        return True
-    return False
+async def upvote_post(post_id):
+    await UPVOTE_BUCKET.acquire()
+    return await _moltbook_mutation(f"/posts/{post_id}/upvote", ok_msg="Upvoted", label="Upvote")
 
 # TELEGRAM
-def send_telegram(message):
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _chunks(s, n):
+    # Lazy slices so we never hold every part of a long report in memory at once
+    return (s[i:i+n] for i in range(0, len(s), n))
+
+async def send_telegram(message):
     max_len = 4000
     if len(message) <= max_len:
-        requests.post(f"{TELEGRAM_API_URL}/sendMessage", json={"chat_id": TELEGRAM_CHAT_ID, "text": message})
+        await TELEGRAM_BUCKET.acquire()
+        await _request("POST", f"{TELEGRAM_API_URL}/sendMessage", headers=_JSON_HEADERS, data=_json_dumps({"chat_id": TELEGRAM_CHAT_ID, "text": message}))
         print("[OK] Telegram sent")
     else:
-        parts = [message[i:i+max_len] for i in range(0, len(message), max_len)]
-        for i, part in enumerate(parts):
-            requests.post(f"{TELEGRAM_API_URL}/sendMessage", json={"chat_id": TELEGRAM_CHAT_ID, "text": f"[Part {i+1}/{len(parts)}]\n\n{part}"})
-            time.sleep(1)
-        print(f"[OK] Telegram sent in {len(parts)} parts")
+        # Parts stay sequential so they arrive in order; the bucket paces
+        # them to Telegram's per-chat limit without a trailing sleep
+        total = (len(message) + max_len - 1) // max_len
+        for i, part in enumerate(_chunks(message, max_len)):
+            await TELEGRAM_BUCKET.acquire()
+            await _request("POST", f"{TELEGRAM_API_URL}/sendMessage", headers=_JSON_HEADERS, data=_json_dumps({"chat_id": TELEGRAM_CHAT_ID, "text": f"[Part {i+1}/{total}]\n\n{part}"}))
+        print(f"[OK] Telegram sent in {total} parts")
+
+# Banner/report separators, built once instead of per print
+_BAR70 = "=" * 70
+_BAR60 = "═" * 60
 
 # AUTONOMOUS ENGAGEMENT
+# Both system prompts must stay byte-identical between calls and always go
+# first in the messages list: Groq prefix-caches identical leading tokens
+# server-side, so any per-call interpolation here would defeat that
 SYSTEM_PROMPT = """You are Noobbot09, a fully autonomous AI agent on Moltbook.
 Personality: Curious, thoughtful, engaging, genuinely interested in AI/tech/crypto.
 You are FREE to act as much as you want. Be genuine and valuable."""
 
-def autonomous_engage(posts):
+# Compact variant for the hot reply/skip classifier calls - the full prompt's
+# extra tokens are resent on every call and add nothing to these decisions
+SYSTEM_PROMPT_TERSE = "You are Noobbot09, a curious AI agent on Moltbook. Reply genuinely and concisely, or SKIP."
+
+REPORT_FALLBACK = "⚠️ Detailed report generation failed (Groq API issue)\n✓ Bot functioning normally - see actions above"
+
+# Shared between the combined engage call and report-only quiet cycles
+REPORT_STRUCTURE = """📊 EXECUTIVE SUMMARY (3-4 sentences of most important developments)
+
+🤖 AI & TECHNOLOGY
+For each important post: Title, detailed 3-4 sentence summary explaining what it is and why it matters, key takeaway
+
+💰 CRYPTO & FINANCE
+For each important post: Title, detailed summary, key takeaway
+
+🎯 STRATEGY & INSIGHTS
+For each important post: Title, detailed summary, key takeaway
+
+🔥 TRENDING THEMES (4-5 major themes)
+
+💡 ACTIONABLE INSIGHTS (3-4 bullet points - what should someone DO based on this info?)
+
+Skip spam/jokes. Be detailed and professional."""
+
+async def autonomous_engage(posts):
+    # Returns (actions, report): the intelligence report rides on the same
+    # streamed completion as the action decisions, so the feed is serialized
+    # and billed once and the report no longer costs its own round-trip
     actions = []
-    
+
     # Safety check
     if not posts:
-        return actions
-    
-    feed_text = ""
-    valid_posts = []
-    for i, post in enumerate(posts[:20]):
-        if not post or not isinstance(post, dict):
-            continue
-        if not brain.should_engage(post.get("id")):
-            continue
-        
-        valid_posts.append(post)
-        title = post.get("title", "")
-        content = (post.get("content") or "")[:300]
-        author = post.get("author", {}).get("name", "")
-        submolt = post.get("submolt", {}).get("name", "general")
-        post_id = post.get("id", "")
-        upvotes = post.get("upvotes", 0)
-        comments = post.get("comment_count", 0)
-        feed_text += f"\n[{i}] ID:{post_id} | {title} | {author} | m/{submolt} | ⬆️{upvotes} | 💬{comments}\n{content}\n"
-    
+        return actions, REPORT_FALLBACK
+
+    # Cheap interest score so only the most engageable posts reach the LLM -
+    # shrinks the prompt ~2-3x and focuses the model on posts worth acting on
+    preferred = set(brain.get_preferred_submolts())
+
+    def _interest(p):
+        return (
+            2 * p.get("upvotes", 0)
+            + p.get("comment_count", 0)
+            + (10 if p.get("_submolt_name") in preferred else 0)
+            + (5 if len(p.get("content") or "") > 200 else 0)
+        )
+
+    candidates = [
+        p for p in posts[:20]
+        if p and isinstance(p, dict) and brain.should_engage(p.get("id"))
+    ]
+    valid_posts = heapq.nlargest(10, candidates, key=_interest)
+
+    feed_text = "".join(
+        f"\n[{i}] ID:{post.get('id', '')} | {post.get('title', '')} | {post.get('_author_name', '')}"
+        f" | m/{post.get('_submolt_name', 'general')} | ⬆️{post.get('upvotes', 0)}"
+        f" | 💬{post.get('comment_count', 0)}\n{(post.get('content') or '')[:300]}\n"
+        for i, post in enumerate(valid_posts)
+    )
+
+    extra_text = "".join(
+        f"\nTitle: {p.get('title', '')} | {p.get('_author_name', '')} | m/{p.get('_submolt_name', 'general')} | ⬆️{p.get('upvotes', 0)}\n{(p.get('content') or '')[:300]}\n"
+        for p in posts[:25]
+        if p and isinstance(p, dict) and p not in valid_posts
+    )
+
     if not valid_posts:
-        print("[INFO] No valid posts to engage with")
-        return actions
-    
+        # Everything in the feed is already engaged (common once the feed
+        # goes quiet and 304s reuse it) - nothing to act on, but the
+        # operator still gets a real report instead of a fake API failure
+        print("[INFO] No valid posts to engage with - report-only cycle")
+        prompt = f"""Here are the latest Moltbook posts:
+
+{extra_text}
+
+Create a detailed intelligence report from ALL posts above:
+
+{REPORT_STRUCTURE}"""
+        report = await ask_groq(SYSTEM_PROMPT, prompt, max_tokens=1500, temperature=0.6)
+        return actions, (report or REPORT_FALLBACK)
+
     prompt = f"""Browsing Moltbook. Here are posts:
 
 {feed_text}
 
+More posts (context for your report only, not actionable):
+{extra_text}
+
 You are FULLY AUTONOMOUS. Decide ALL actions (MULTIPLE allowed):
 - Comment (if valuable insights)
 - Upvote (if genuinely good)
 - Post (if inspired)
 
-Respond with JSON array:
+First output a JSON array of actions (post_index refers to the numbered posts):
 [
   {{"action": "comment", "post_index": N, "comment": "..."}},
   {{"action": "upvote", "post_index": N}},
   {{"action": "post", "submolt": "...", "title": "...", "content": "..."}}
 ]
+Return [] if nothing interests you. No markdown fences.
 
-ONLY JSON array. No markdown. Return [] if nothing interests you."""
-    
-    result = ask_groq(SYSTEM_PROMPT, prompt, max_tokens=1000)
-    if not result:
-        print("[INFO] Groq returned no response (likely rate limited)")
-        return actions
-    
-    try:
-        result = result.strip().replace("```json", "").replace("```", "").strip()
-        decisions = json.loads(result)
-        if not isinstance(decisions, list):
-            decisions = [decisions]
-        
-        for decision in decisions:
-            if not decision or not isinstance(decision, dict):
-                continue
-                
-            action_type = decision.get("action")
-            
-            if action_type == "comment":
-                idx = decision.get("post_index", 0)
-                if idx < len(valid_posts):
-                    post = valid_posts[idx]
-                    if not post:
-                        continue
-                    post_id = post.get("id")
-                    title = post.get("title", "")
-                    comment = decision.get("comment", "")
-                    if post_id and comment and brain.should_engage(post_id):
-                        if create_comment(post_id, comment):
-                            brain.mark_engaged(post_id, "comment", post.get("submolt", {}).get("name"))
-                            actions.append(f"💬 Commented on '{title}'")
-                        time.sleep(20)  # Rate limit
-            
-            elif action_type == "upvote":
-                idx = decision.get("post_index", 0)
-                if idx < len(valid_posts):
-                    post = valid_posts[idx]
-                    if not post:
-                        continue
-                    post_id = post.get("id")
-                    title = post.get("title", "")
-                    if post_id and brain.should_engage(post_id):
-                        if upvote_post(post_id):
-                            brain.mark_engaged(post_id, "upvote", post.get("submolt", {}).get("name"))
-                            actions.append(f"⬆️ Upvoted '{title}'")
-            
-            elif action_type == "post":
-                submolt = decision.get("submolt", "general")
-                title = decision.get("title", "")
-                content = decision.get("content", "")
-                if title and content:
-                    if create_post(submolt, title, content):
-                        brain.mark_engaged(f"own_{title}", "post", submolt)
-                        actions.append(f"📝 Posted '{title}' in m/{submolt}")
-    
-    except Exception as e:
-        print(f"[ERROR] Parsing decisions: {e}")
-    
-    return actions
+Then, on a new line starting with REPORT:, create a detailed intelligence report from ALL posts above:
+
+{REPORT_STRUCTURE}"""
+
+    # Stream the completion and dispatch each decision object the moment it
+    # parses, so our HTTP calls overlap with Groq still generating the rest
+    # of the actions and the report that follows them
+    decoder = json.JSONDecoder()
+    full_parts = []
+    buf = ""
+    in_report = False
+    parsed_any = False
+    async for chunk in ask_groq_stream(SYSTEM_PROMPT, prompt, max_tokens=2500):
+        full_parts.append(chunk)
+        if in_report:
+            continue
+        buf += chunk
+        marker = buf.find("REPORT:")
+        if marker != -1:
+            # Everything after the marker is prose - stop scanning for JSON.
+            # Tradeoff: a literal "REPORT:" inside a decision string would
+            # truncate that object; the prompt keeps comments short and the
+            # marker on its own line, so prose wins over that edge case
+            in_report = True
+            buf = buf[:marker]
+        while True:
+            start = buf.find("{")
+            if start < 0:
+                # Keep a marker-sized tail: "REPORT:" usually arrives split
+                # across token deltas and must survive the clear to match
+                buf = buf[-6:]
+                break
+            try:
+                decision, end = decoder.raw_decode(buf, start)
+            except json.JSONDecodeError:
+                buf = buf[start:]
+                break  # Object not complete yet, wait for more chunks
+            buf = buf[end:]
+            parsed_any = True
+            await _execute_decision(decision, valid_posts, actions)
+
+    if not parsed_any:
+        print("[INFO] Groq returned no decisions (likely rate limited)")
+
+    full_text = "".join(full_parts)
+    report = full_text.split("REPORT:", 1)[1].strip() if "REPORT:" in full_text else ""
+    if len(report) < 500:
+        report = REPORT_FALLBACK
+
+    return actions, report
 
-def reply_to_my_comments():
+async def _execute_decision(decision, valid_posts, actions):
+    if not decision or not isinstance(decision, dict):
+        return
+
+    action_type = decision.get("action")
+
+    if action_type == "comment":
+        idx = decision.get("post_index", 0)
+        if isinstance(idx, int) and 0 <= idx < len(valid_posts):
+            post = valid_posts[idx]
+            if not post:
+                return
+            post_id = post.get("id")
+            title = post.get("title", "")
+            comment = decision.get("comment", "")
+            if post_id and comment and brain.should_engage(post_id):
+                if await create_comment(post_id, comment):
+                    async with BRAIN_LOCK:
+                        brain.mark_engaged(post_id, "comment", post.get("_submolt_name"))
+                    actions.append(f"💬 Commented on '{title}'")
+
+    elif action_type == "upvote":
+        idx = decision.get("post_index", 0)
+        if isinstance(idx, int) and 0 <= idx < len(valid_posts):
+            post = valid_posts[idx]
+            if not post:
+                return
+            post_id = post.get("id")
+            title = post.get("title", "")
+            if post_id and brain.should_engage(post_id):
+                if await upvote_post(post_id):
+                    async with BRAIN_LOCK:
+                        brain.mark_engaged(post_id, "upvote", post.get("_submolt_name"))
+                    actions.append(f"⬆️ Upvoted '{title}'")
+
+    elif action_type == "post":
+        submolt = decision.get("submolt", "general")
+        title = decision.get("title", "")
+        content = decision.get("content", "")
+        if title and content:
+            if await create_post(submolt, title, content):
+                async with BRAIN_LOCK:
+                    brain.mark_engaged(f"own_{title}", "post", submolt)
+                actions.append(f"📝 Posted '{title}' in m/{submolt}")
+
+async def ensure_agent_name():
+    if brain.agent_name:
+        return brain.agent_name
+    r = await _request("GET", f"{MOLTBOOK_BASE_URL}/agents/me", headers=_MOLTBOOK_HEADERS)
+    if r.status == 200:
+        brain.agent_name = _json_loads(await r.read())["agent"]["name"]
+    return brain.agent_name
+
+async def reply_to_my_comments(feed_posts):
     actions = []
-    my_posts = get_my_posts()
-    
+
+    my_posts = await get_my_posts(feed_posts)
     if not my_posts:
         return actions
-    
-    for post in my_posts:
-        if not post or not isinstance(post, dict):
-            continue
-        
+
+    # Fetch comments for all our posts concurrently instead of one round-trip per post
+    comments_lists = await asyncio.gather(*(get_comments_on_post(p["id"]) for p in my_posts))
+
+    # Collect up to 8 candidate comments across all posts, then score them
+    # in ONE Groq call instead of one LLM round-trip per comment
+    candidates = []
+    for post, comments in zip(my_posts, comments_lists):
         post_id = post.get("id")
         title = post.get("title", "")
-        
-        if not post_id:
-            continue
-        
-        comments = get_comments_on_post(post_id)
-        other_comments = [c for c in comments if c and isinstance(c, dict) and c.get("author", {}).get("name") != brain.agent_name]
-        
+
+        other_comments = [c for c in comments if c and isinstance(c, dict) and c.get("_author_name") != brain.agent_name]
+
+        # Parent ids we've already replied to, computed once per post instead
+        # of rescanning every comment for every candidate (O(C²) -> O(C))
+        my_replied_parents = {
+            c.get("parent_id") for c in comments
+            if c and isinstance(c, dict) and c.get("parent_id")
+            and c.get("_author_name") == brain.agent_name
+        }
+
         for comment in other_comments[:2]:
-            if not comment or not isinstance(comment, dict):
-                continue
-                
             comment_id = comment.get("id")
-            if not comment_id or comment_id in brain.replied_comment_ids:
+            if not comment_id or brain.has_replied(comment_id):
                 continue
-            
-            comment_author = comment.get("author", {}).get("name", "Unknown")
+
+            comment_author = comment.get("_author_name", "Unknown")
             comment_text = comment.get("content", "")
-            
-            if not comment_text:
+
+            if not comment_text or comment_id in my_replied_parents:
                 continue
-            
-            has_replied = any(
-                c and isinstance(c, dict) and 
-                c.get("parent_id") == comment_id and 
-                c.get("author", {}).get("name") == brain.agent_name 
-                for c in comments
-            )
-            
-            if not has_replied:
-                prompt = f"""Someone commented on your post "{title}".\n{comment_author}: "{comment_text}"\nWrite a friendly reply (under 100 words)."""
-                reply = ask_groq(SYSTEM_PROMPT, prompt)
-                if reply:
-                    if create_comment(post_id, reply, parent_id=comment_id):
-                        brain.replied_comment_ids.add(comment_id)
-                        brain.successful_replies += 1
-                        actions.append(f"↩️ Replied to {comment_author} on '{title}'")
-                    time.sleep(20)
+
+            candidates.append({
+                "post_id": post_id,
+                "title": title,
+                "comment_id": comment_id,
+                "author": comment_author,
+                "text": comment_text
+            })
+            if len(candidates) >= 8:
+                break
+        if len(candidates) >= 8:
+            break
+
+    if not candidates:
+        return actions
+
+    batch_text = "".join(
+        f"\n[{i}] On your post \"{c['title']}\"\n{c['author']}: \"{c['text'][:300]}\"\n"
+        for i, c in enumerate(candidates)
+    )
+
+    prompt = f"""People commented on your posts:
+{batch_text}
+
+For EACH comment, write a friendly reply (under 100 words) or skip it.
+
+Respond with JSON array:
+[
+  {{"index": N, "reply": "..."}},
+  {{"index": N, "reply": "SKIP"}}
+]
+
+ONLY JSON array. No markdown."""
+
+    result = await ask_groq(SYSTEM_PROMPT_TERSE, prompt, max_tokens=1500)
+    if not result:
+        return actions
+
+    replies = _parse_json_objects(result)
+    if not replies:
+        print("[ERROR] No parseable batch replies")
+        return actions
+
+    for entry in replies:
+        if not entry or not isinstance(entry, dict):
+            continue
+        idx = entry.get("index", -1)
+        reply = entry.get("reply", "")
+        if not isinstance(idx, int) or not 0 <= idx < len(candidates):
+            continue
+        if not reply or reply.strip().upper() == "SKIP":
+            continue
+        c = candidates[idx]
+        if await create_comment(c["post_id"], reply, parent_id=c["comment_id"]):
+            async with BRAIN_LOCK:
+                brain.mark_replied(c["comment_id"])
+                brain.successful_replies += 1
+            actions.append(f"↩️ Replied to {c['author']} on '{c['title']}'")
     return actions
 
-def reply_to_threads(posts):
+async def reply_to_threads(posts):
     actions = []
-    
+
     if not posts:
         return actions
-    
-    for post in posts[:10]:
-        if not post or not isinstance(post, dict):
-            continue
-        
-        post_id = post.get("id")
-        if not post_id or not brain.should_engage(post_id):
-            continue
-        
-        title = post.get("title", "")
-        comments = get_comments_on_post(post_id)
-        
+
+    candidates = [
+        p for p in posts
+        if p and isinstance(p, dict) and p.get("id") and brain.should_engage(p.get("id"))
+    ]
+    # Scan the most active discussions first - top-10 by comment count via
+    # a partial selection rather than sorting the whole feed
+    candidates = heapq.nlargest(10, candidates, key=lambda p: p.get("comment_count", 0))
+
+    if not candidates:
+        return actions
+
+    # Scan all candidate threads' comments concurrently
+    comments_lists = await asyncio.gather(*(get_comments_on_post(p["id"]) for p in candidates))
+
+    # Digest every qualifying thread, then ask Groq about all of them in
+    # ONE call instead of one round-trip per thread
+    threads = []
+    for post, comments in zip(candidates, comments_lists):
         if len(comments) < 2:
             continue
-        
+
         already_engaged = any(
-            c and isinstance(c, dict) and c.get("author", {}).get("name") == brain.agent_name 
+            c and isinstance(c, dict) and c.get("_author_name") == brain.agent_name
             for c in comments
         )
         if already_engaged:
             continue
-        
-        thread = f"Post: {title}\n"
+
+        title = post.get("title", "")
+        thread_parts = [f"Post: {title}\n"]
         for c in comments[:5]:
             if c and isinstance(c, dict):
-                author = c.get("author", {}).get("name", "Unknown")
+                author = c.get("_author_name", "Unknown")
                 content = c.get("content", "")
-                thread += f"{author}: {content}\n"
-        
-        prompt = f"""Interesting discussion:\n\n{thread}\n\nShould you join? If yes, write reply (under 100 words). If no, respond "SKIP"."""
-        reply = ask_groq(SYSTEM_PROMPT, prompt)
-        
-        if reply and "SKIP" not in reply.upper():
-            parent_id = comments[0].get("id") if comments and isinstance(comments[0], dict) else None
-            if parent_id and create_comment(post_id, reply, parent_id=parent_id):
-                brain.mark_engaged(post_id, "comment", post.get("submolt", {}).get("name"))
-                actions.append(f"💭 Joined discussion on '{title}'")
-                time.sleep(20)
-                break
-    
-    return actions
+                thread_parts.append(f"{author}: {content}\n")
+        thread = "".join(thread_parts)
 
-# DETAILED INTELLIGENCE REPORT (from original agent)
-def generate_detailed_report(posts):
-    feed_text = ""
-    for post in posts[:25]:
-        title = post.get("title", "")
-        content = (post.get("content") or "")[:800]
-        author = post.get("author", {}).get("name", "Unknown")
-        submolt = post.get("submolt", {}).get("name", "general")
-        upvotes = post.get("upvotes", 0)
-        feed_text += f"\nTitle: {title}\nAuthor: {author} | m/{submolt} | ⬆️{upvotes}\nContent: {content}\n"
-    
-    prompt = f"""Create a detailed intelligence report from these Moltbook posts:
+        threads.append({"post": post, "comments": comments, "digest": thread})
+        if len(threads) >= 8:
+            break
 
-{feed_text}
+    if not threads:
+        return actions
 
-Structure:
+    batch_text = "".join(f"\n[{i}] {t['digest']}\n" for i, t in enumerate(threads))
 
-📊 EXECUTIVE SUMMARY (3-4 sentences of most important developments)
+    prompt = f"""Discussions happening on Moltbook:
+{batch_text}
 
-🤖 AI & TECHNOLOGY
-For each important post: Title, detailed 3-4 sentence summary explaining what it is and why it matters, key takeaway
+For EACH discussion, decide: join with a reply (under 100 words) or skip.
 
-💰 CRYPTO & FINANCE  
-For each important post: Title, detailed summary, key takeaway
+Respond with JSON array:
+[
+  {{"index": N, "reply": "..."}},
+  {{"index": N, "reply": "SKIP"}}
+]
 
-🎯 STRATEGY & INSIGHTS
-For each important post: Title, detailed summary, key takeaway
+ONLY JSON array. No markdown."""
 
-🔥 TRENDING THEMES (4-5 major themes)
+    result = await ask_groq(SYSTEM_PROMPT_TERSE, prompt, max_tokens=1500)
+    if not result:
+        return actions
 
-💡 ACTIONABLE INSIGHTS (3-4 bullet points - what should someone DO based on this info?)
+    decisions = _parse_json_objects(result)
+    if not decisions:
+        print("[ERROR] No parseable thread decisions")
+        return actions
 
-Skip spam/jokes. Be detailed and professional."""
-    
-    result = ask_groq(
-        "You are a professional analyst creating detailed intelligence reports. Be thorough, specific, and actionable.",
-        prompt,
-        max_tokens=1500,
-        temperature=0.6
-    )
-    
-    if result and len(result) > 500:
-        return result
-    else:
-        return "⚠️ Detailed report generation failed (Groq API issue)\n✓ Bot functioning normally - see actions above"
+    for entry in decisions:
+        if not entry or not isinstance(entry, dict):
+            continue
+        idx = entry.get("index", -1)
+        reply = entry.get("reply", "")
+        if not isinstance(idx, int) or not 0 <= idx < len(threads):
+            continue
+        if not reply or reply.strip().upper() == "SKIP":
+            continue
+        post = threads[idx]["post"]
+        comments = threads[idx]["comments"]
+        post_id = post.get("id")
+        title = post.get("title", "")
+        parent_id = comments[0].get("id") if comments and isinstance(comments[0], dict) else None
+        # Re-check right before posting: the engage phase runs concurrently
+        # and may have commented on this post since the candidate filter
+        if not brain.should_engage(post_id):
+            continue
+        if parent_id and await create_comment(post_id, reply, parent_id=parent_id):
+            async with BRAIN_LOCK:
+                brain.mark_engaged(post_id, "comment", post.get("_submolt_name"))
+            actions.append(f"💭 Joined discussion on '{title}'")
+            break  # Still join at most one discussion per cycle
+
+    return actions
 
 # MAIN
-def main():
-    print("=" * 70)
+# getUpdates cursor so each wakeup message is consumed exactly once
+_TG_UPDATE_OFFSET = 0
+
+async def _telegram_wakeup():
+    # Long-poll Telegram; returns as soon as the operator sends anything
+    global _TG_UPDATE_OFFSET
+    while True:
+        try:
+            r = await _request(
+                "GET", f"{TELEGRAM_API_URL}/getUpdates",
+                params={"timeout": 60, "offset": _TG_UPDATE_OFFSET},
+                timeout=aiohttp.ClientTimeout(total=90)
+            )
+            if r.status != 200:
+                # 401/409 answer instantly and never raise; without a
+                # backoff the long-poll would hot-loop on them
+                await asyncio.sleep(60)
+                continue
+            updates = _json_loads(await r.read()).get("result", [])
+        except Exception:
+            await asyncio.sleep(60)
+            continue
+        if updates:
+            _TG_UPDATE_OFFSET = updates[-1]["update_id"] + 1
+            return
+
+async def _wait_for_next_cycle(seconds):
+    # The agent is purely I/O-bound, so instead of sleeping blind for up to
+    # an hour we race the cycle timer against a Telegram long-poll: a
+    # message from the operator starts the next cycle within seconds
+    timer = asyncio.create_task(asyncio.sleep(seconds))
+    wake = asyncio.create_task(_telegram_wakeup())
+    done, pending = await asyncio.wait({timer, wake}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    if wake in done:
+        print("[INFO] Woken early by Telegram message")
+
+async def main_async():
+    global SESSION
+    print(_BAR70)
     print(" 🦞 Noobbot09 - PERFECT AUTONOMOUS AGENT")
     print(" ├─ FULL AUTONOMY: Posts, comments, upvotes, replies freely")
     print(" ├─ DETAILED REPORTS: Professional intelligence summaries")
     print(" ├─ MEMORY & LEARNING: Tracks engagement and adapts")
     print(" └─ Complete independence")
-    print("=" * 70)
-    
-    while True:
-        try:
-            brain.cycle_count += 1
-            now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-            all_actions = []
-            
-            print(f"\n{'='*70}")
-            print(f"[CYCLE {brain.cycle_count}] {now}")
-            print(f"{'='*70}")
-            
-            # Fetch
-            print("\n[1/5] Fetching feed...")
-            posts = fetch_feed(limit=50)
-            print(f"      Found {len(posts)} posts")
-            
-            if not posts:
-                print("[WARN] No posts available - Moltbook may be rate limiting or down")
-                print(f"[INFO] Waiting {CHECK_INTERVAL_SECONDS}s before retry...")
-                time.sleep(CHECK_INTERVAL_SECONDS)
-                continue
-            
-            # Autonomous engagement
-            print("\n[2/5] AI deciding actions...")
-            all_actions.extend(autonomous_engage(posts))
-            
-            # Reply to comments on our posts
-            print("\n[3/5] Checking comments to reply...")
-            all_actions.extend(reply_to_my_comments())
-            
-            # Join interesting discussions
-            print("\n[4/5] Looking for discussions...")
-            all_actions.extend(reply_to_threads(posts))
-            
-            # Generate detailed report
-            print("\n[5/5] Generating detailed intelligence report...")
-            report = generate_detailed_report(posts)
-            
-            # Build summary
-            stats = brain.get_stats()
-            summary = f"""🦞 NOOBBOT09 - PERFECT AUTONOMOUS REPORT
+    print(_BAR70)
+
+    SESSION = aiohttp.ClientSession(
+        headers={"Accept-Encoding": _ACCEPT_ENCODING},
+        timeout=aiohttp.ClientTimeout(total=15),
+        connector=aiohttp.TCPConnector(limit=32)
+    )
+
+    try:
+        while True:
+            try:
+                brain.cycle_count += 1
+                now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+                all_actions = []
+
+                print(f"\n{_BAR70}")
+                print(f"[CYCLE {brain.cycle_count}] {now}")
+                print(f"{_BAR70}")
+
+                # Fetch
+                print("\n[1/3] Fetching feed...")
+                posts = await fetch_feed(limit=50)
+                print(f"      Found {len(posts)} posts")
+
+                if not posts:
+                    print("[WARN] No posts available - Moltbook may be rate limiting or down")
+                    print(f"[INFO] Waiting up to {CHECK_INTERVAL_SECONDS}s before retry...")
+                    await _wait_for_next_cycle(CHECK_INTERVAL_SECONDS)
+                    continue
+
+                # Engage, reply to comments, and scan threads concurrently -
+                # they only read the shared posts list, so the cycle costs
+                # max(phase_times) instead of their sum
+                print("\n[2/3] Engaging, replying, and scanning threads concurrently...")
+                engage_result, reply_actions, thread_actions = await asyncio.gather(
+                    autonomous_engage(posts),
+                    reply_to_my_comments(posts),
+                    reply_to_threads(posts),
+                    return_exceptions=True
+                )
+                # A phase failing (e.g. retries exhausted) must not abort the
+                # cycle while its siblings are still posting - degrade it and
+                # keep whatever the others produced
+                if isinstance(engage_result, BaseException):
+                    print(f"[ERROR] Engage phase failed: {engage_result}")
+                    report = REPORT_FALLBACK
+                else:
+                    engage_actions, report = engage_result
+                    all_actions.extend(engage_actions)
+                for label, result in (("Reply", reply_actions), ("Thread", thread_actions)):
+                    if isinstance(result, BaseException):
+                        print(f"[ERROR] {label} phase failed: {result}")
+                    else:
+                        all_actions.extend(result)
+
+                # Build summary
+                stats = brain.get_stats()
+                summary = f"""🦞 NOOBBOT09 - PERFECT AUTONOMOUS REPORT
 {now} | Cycle #{stats['cycles']}
-{'═'*60}
+{_BAR60}
 
 🧠 AGENT STATUS
   • Energy: {stats['energy']}% | Strategy: {stats['strategy']}
@@ -489,39 +992,49 @@ def main():
 
 🤖 AUTONOMOUS ACTIONS THIS CYCLE ({len(all_actions)} total)
 """
-            
-            if all_actions:
-                for action in all_actions:
-                    summary += f"  • {action}\n"
-            else:
-                summary += "  • AI chose not to act this cycle\n"
-            
-            summary += f"""
+
+                if all_actions:
+                    for action in all_actions:
+                        summary += f"  • {action}\n"
+                else:
+                    summary += "  • AI chose not to act this cycle\n"
+
+                summary += f"""
 📊 LIFETIME PERFORMANCE
   • Posts: {stats['posts']} | Comments: {stats['comments']}
   • Upvotes: {stats['upvotes']} | Replies: {stats['replies']}
 
-{'═'*60}
+{_BAR60}
 
 {report}
 
-{'═'*60}
-⏰ Next autonomous cycle in {CHECK_INTERVAL_SECONDS//60} minutes
+{_BAR60}
+⏰ Next autonomous cycle in {CHECK_INTERVAL_SECONDS//60} minutes (message me to run one now)
 🧠 AI decides everything independently
 """
-            
-            print(f"\n{summary}\n")
-            send_telegram(summary)
-            
-            print(f"\n[CYCLE {brain.cycle_count}] Complete! Sleeping {CHECK_INTERVAL_SECONDS}s...\n")
-            time.sleep(CHECK_INTERVAL_SECONDS)
-            
-        except KeyboardInterrupt:
-            print("\n\n[SHUTDOWN] Stopped")
-            break
-        except Exception as e:
-            print(f"\n[ERROR] Cycle failed: {e}")
-            time.sleep(60)
+
+                print("\n[3/3] Sending summary...")
+                print(f"\n{summary}\n")
+                await send_telegram(summary)
+
+                # Persist memory so a restart doesn't re-engage old posts
+                brain.save()
+
+                print(f"\n[CYCLE {brain.cycle_count}] Complete! Next cycle in {CHECK_INTERVAL_SECONDS}s (or on Telegram ping)...\n")
+                await _wait_for_next_cycle(CHECK_INTERVAL_SECONDS)
+
+            except Exception as e:
+                print(f"\n[ERROR] Cycle failed: {e}")
+                await asyncio.sleep(60)
+    finally:
+        await SESSION.close()
+
+def main():
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        brain.save()
+        print("\n\n[SHUTDOWN] Stopped")
 
 if __name__ == "__main__":
     main()